@@ -14,27 +14,36 @@ This opens a window where you can:
 from __future__ import annotations
 
 import math
+import re
 import sys
+import threading
 from pathlib import Path
 
 import tkinter as tk
 from tkinter import ttk, messagebox
 
 from aus_tree_calc_standalone import (
+    SPECIES_BY_ID,
+    SPECIES_IDS,
     SPECIES_PRESETS,
     SpeciesPreset,
     calculate_single,
     compute_defect_strength_factor,
     estimate_wind_to_failure,
     residual_wall_fraction,
-    build_sf_vs_wind_curve,
-    build_sf_vs_residual_wall_curve,
-    build_sf_vs_crown_reduction_curve,
+    build_all_curves,
     build_word_report_from_python,
     CalcResult,
 )
 
 
+# Accepts plain decimals with either "." or "," as the separator; checked
+# before float() so invalid entries never take the exception path.
+_NUM_RE = re.compile(r"^\s*-?(?:\d+(?:[.,]\d*)?|[.,]\d+)\s*$")
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+
+
 class AusTreeCalcGUI(tk.Tk):
     def __init__(self) -> None:
         super().__init__()
@@ -52,6 +61,7 @@ class AusTreeCalcGUI(tk.Tk):
 
         # Species
         self.species_var = tk.StringVar(value=SPECIES_PRESETS[1].id)
+        self.species_desc_var = tk.StringVar(value=SPECIES_PRESETS[1].name)
 
         # Numeric inputs
         self.dbh_var = tk.StringVar(value="50")
@@ -79,6 +89,39 @@ class AusTreeCalcGUI(tk.Tk):
         # Output text
         self._last_result: CalcResult | None = None
 
+        # Pending debounce timer for species-change updates
+        self._species_after_id: str | None = None
+
+        # In-flight report worker; only one build may run at a time
+        self._report_thread: threading.Thread | None = None
+
+        # Registry of every Tk variable, so a run can snapshot them in one
+        # pass instead of crossing the Tcl boundary per .get() call site.
+        self._all_vars = {
+            "tree_label": self.tree_label_var,
+            "site_location": self.site_location_var,
+            "species": self.species_var,
+            "dbh": self.dbh_var,
+            "height": self.height_var,
+            "crown": self.crown_var,
+            "cavity": self.cavity_var,
+            "wind": self.wind_var,
+            "site_factor": self.site_factor_var,
+            "use_fullness_override": self.use_fullness_override_var,
+            "fullness": self.fullness_var,
+            "def_bracket": self.def_bracket_var,
+            "def_cavity_decay": self.def_cavity_decay_var,
+            "def_cracks": self.def_cracks_var,
+            "def_basal": self.def_basal_var,
+            "def_union": self.def_union_var,
+            "def_other": self.def_other_var,
+            "crown_red_base": self.crown_reduction_base_var,
+            "fullness_red": self.fullness_reduction_var,
+        }
+
+    def _snapshot_vars(self) -> dict:
+        return {key: var.get() for key, var in self._all_vars.items()}
+
     # ---------------- UI construction -----------------
     def _build_widgets(self) -> None:
         container = ttk.Frame(self, padding=10)
@@ -108,13 +151,15 @@ class AusTreeCalcGUI(tk.Tk):
             tree_frame,
             textvariable=self.species_var,
             state="readonly",
-            values=[sp.id for sp in SPECIES_PRESETS],
+            values=SPECIES_IDS,
         )
         species_combo.grid(row=2, column=1, sticky="ew", pady=2)
         species_combo.bind("<<ComboboxSelected>>", self._on_species_change)
-        # Show human-readable names as tooltip-ish text via label
+        # Show human-readable names as tooltip-ish text via label; bound to
+        # a StringVar so updates only diff the string instead of
+        # reconfiguring the widget.
         self.species_desc_label = ttk.Label(
-            tree_frame, text=SPECIES_PRESETS[1].name, wraplength=340
+            tree_frame, textvariable=self.species_desc_var, wraplength=340
         )
         self.species_desc_label.grid(row=3, column=0, columnspan=2, sticky="w", pady=2)
 
@@ -123,20 +168,22 @@ class AusTreeCalcGUI(tk.Tk):
         geo_frame.grid(row=0, column=1, sticky="nsew", padx=4, pady=4)
         geo_frame.columnconfigure(1, weight=1)
 
-        def _add_row(label: str, var: tk.StringVar, row: int, unit: str = "") -> None:
+        geo_rows = [
+            ("DBH:", self.dbh_var, "cm"),
+            ("Height:", self.height_var, "m"),
+            ("Crown diameter:", self.crown_var, "m"),
+            ("Cavity inner diameter:", self.cavity_var, "cm"),
+            ("Design wind speed:", self.wind_var, "m/s"),
+            ("Site factor:", self.site_factor_var, "0.5–1.5"),
+        ]
+        for row, (label, var, unit) in enumerate(geo_rows):
             ttk.Label(geo_frame, text=label).grid(row=row, column=0, sticky="w")
-            entry = ttk.Entry(geo_frame, textvariable=var, width=10)
-            entry.grid(row=row, column=1, sticky="w", pady=2)
+            ttk.Entry(geo_frame, textvariable=var, width=10).grid(
+                row=row, column=1, sticky="w", pady=2
+            )
             if unit:
                 ttk.Label(geo_frame, text=unit).grid(row=row, column=2, sticky="w")
 
-        _add_row("DBH:", self.dbh_var, 0, "cm")
-        _add_row("Height:", self.height_var, 1, "m")
-        _add_row("Crown diameter:", self.crown_var, 2, "m")
-        _add_row("Cavity inner diameter:", self.cavity_var, 3, "cm")
-        _add_row("Design wind speed:", self.wind_var, 4, "m/s")
-        _add_row("Site factor:", self.site_factor_var, 5, "0.5–1.5")
-
         fullness_check = ttk.Checkbutton(
             geo_frame,
             text="Override crown fullness",
@@ -213,12 +260,12 @@ class AusTreeCalcGUI(tk.Tk):
         btn_frame = ttk.Frame(bottom_frame)
         btn_frame.grid(row=0, column=0, sticky="w")
 
-        run_btn = ttk.Button(
+        self.run_btn = ttk.Button(
             btn_frame,
             text="Run calculation & build Word report",
             command=self._on_run,
         )
-        run_btn.grid(row=0, column=0, padx=(0, 8))
+        self.run_btn.grid(row=0, column=0, padx=(0, 8))
 
         quit_btn = ttk.Button(btn_frame, text="Quit", command=self.destroy)
         quit_btn.grid(row=0, column=1)
@@ -234,38 +281,68 @@ class AusTreeCalcGUI(tk.Tk):
 
     # ---------------- Event handlers -----------------
     def _on_species_change(self, _event=None) -> None:  # noqa: ANN001
+        # Debounce: scrolling through the combobox fires a selection event
+        # per entry; only the final selection should touch the Tk vars.
+        if self._species_after_id is not None:
+            self.after_cancel(self._species_after_id)
+        self._species_after_id = self.after(50, self._apply_species_change)
+
+    def _apply_species_change(self) -> None:
+        self._species_after_id = None
         sp = self._get_species()
-        self.species_desc_label.config(text=sp.name)
+        self.species_desc_var.set(sp.name)
         # Also update fullness default display
         if not self.use_fullness_override_var.get():
             self.fullness_var.set(f"{sp.default_fullness:.2f}")
 
     def _get_species(self) -> SpeciesPreset:
-        sid = self.species_var.get()
-        for sp in SPECIES_PRESETS:
-            if sp.id == sid:
-                return sp
-        return SPECIES_PRESETS[1]
-
-    def _parse_float(self, value: str, name: str) -> float | None:
-        try:
-            v = float(value.replace(",", "."))
-        except ValueError:
-            messagebox.showerror("Input error", f"{name} must be a number.")
+        return SPECIES_BY_ID.get(self.species_var.get(), SPECIES_PRESETS[1])
+
+    def _collect_inputs(self, snap: dict) -> dict | None:
+        """Parse and validate every numeric entry in a single pass.
+
+        Works on a plain snapshot dict from _snapshot_vars. Returns a dict
+        of parsed values, or None after showing one error dialog listing
+        all invalid fields (instead of a messagebox per field, losing
+        earlier successes on each failure).
+        """
+        fields = [
+            ("dbh", "DBH"),
+            ("height", "Height"),
+            ("crown", "Crown diameter"),
+            ("wind", "Design wind speed"),
+            ("site_factor", "Site factor"),
+            ("crown_red_base", "Crown reduction (%)"),
+            ("fullness_red", "Fullness reduction (%)"),
+        ]
+        if snap["use_fullness_override"]:
+            fields.append(("fullness", "Fullness override"))
+
+        values: dict = {}
+        errors: list[str] = []
+        for key, name in fields:
+            txt = snap[key]
+            if not _NUM_RE.match(txt):
+                errors.append(f"{name} must be a number.")
+                continue
+            v = float(txt.replace(",", "."))
+            if v <= 0:
+                errors.append(f"{name} must be > 0.")
+                continue
+            values[key] = v
+        if errors:
+            messagebox.showerror("Input error", "\n".join(errors))
             return None
-        if v <= 0:
-            messagebox.showerror("Input error", f"{name} must be > 0.")
-            return None
-        return v
+
+        if "fullness" in values:
+            values["fullness"] = max(0.1, min(1.0, values["fullness"]))
+        values["cavity"] = self._parse_optional_float(snap["cavity"])
+        return values
 
     def _parse_optional_float(self, value: str) -> float | None:
-        v = value.strip()
-        if not v:
-            return None
-        try:
-            num = float(v.replace(",", "."))
-        except ValueError:
+        if not value.strip() or not _NUM_RE.match(value):
             return None
+        num = float(value.replace(",", "."))
         if num <= 0:
             return None
         return num
@@ -275,44 +352,37 @@ class AusTreeCalcGUI(tk.Tk):
         self.output_text.see(tk.END)
 
     def _on_run(self) -> None:
-        # Parse inputs
-        sp = self._get_species()
-
-        dbh = self._parse_float(self.dbh_var.get(), "DBH")
-        height = self._parse_float(self.height_var.get(), "Height")
-        crown = self._parse_float(self.crown_var.get(), "Crown diameter")
-        wind = self._parse_float(self.wind_var.get(), "Design wind speed")
-        site_factor = self._parse_float(self.site_factor_var.get(), "Site factor")
-        if None in (dbh, height, crown, wind, site_factor):
+        # One report build at a time: a second run while the worker is
+        # still going would race on pyplot's global figure state and on
+        # the output .docx file.
+        if self._report_thread is not None and self._report_thread.is_alive():
+            self._append_output("Report build already in progress, please wait…")
             return
-        assert dbh is not None and height is not None and crown is not None
-        assert wind is not None and site_factor is not None
 
-        cavity = self._parse_optional_float(self.cavity_var.get())
+        # Snapshot every Tk variable once, then work on plain Python values
+        snap = self._snapshot_vars()
+        sp = SPECIES_BY_ID.get(snap["species"], SPECIES_PRESETS[1])
 
-        fullness_override = None
-        if self.use_fullness_override_var.get():
-            f = self._parse_float(self.fullness_var.get(), "Fullness override")
-            if f is None:
-                return
-            fullness_override = max(0.1, min(1.0, f))
-
-        crown_red_base = self._parse_float(
-            self.crown_reduction_base_var.get(), "Crown reduction (%)"
-        )
-        fullness_red = self._parse_float(
-            self.fullness_reduction_var.get(), "Fullness reduction (%)"
-        )
-        if crown_red_base is None or fullness_red is None:
+        vals = self._collect_inputs(snap)
+        if vals is None:
             return
+        dbh = vals["dbh"]
+        height = vals["height"]
+        crown = vals["crown"]
+        wind = vals["wind"]
+        site_factor = vals["site_factor"]
+        crown_red_base = vals["crown_red_base"]
+        fullness_red = vals["fullness_red"]
+        cavity = vals["cavity"]
+        fullness_override = vals.get("fullness")
 
         # Defect factors
         k_defect = compute_defect_strength_factor(
-            self.def_bracket_var.get(),
-            self.def_cavity_decay_var.get(),
-            self.def_cracks_var.get(),
-            self.def_basal_var.get(),
-            self.def_union_var.get(),
+            snap["def_bracket"],
+            snap["def_cavity_decay"],
+            snap["def_cracks"],
+            snap["def_basal"],
+            snap["def_union"],
         )
 
         # Core calculation
@@ -329,20 +399,10 @@ class AusTreeCalcGUI(tk.Tk):
         )
         self._last_result = result
 
-        wind_to_failure = estimate_wind_to_failure(
-            sp,
-            dbh,
-            height,
-            crown,
-            wind,
-            cavity,
-            fullness_override,
-            site_factor,
-            k_defect,
-        )
+        wind_to_failure = estimate_wind_to_failure(result, wind)
 
-        # Curves
-        sf_wind_x, sf_wind_y = build_sf_vs_wind_curve(
+        # Curves (single fused pass so shared terms are computed once)
+        sf_wind, sf_wall, sf_red = build_all_curves(
             sp,
             dbh,
             height,
@@ -353,33 +413,16 @@ class AusTreeCalcGUI(tk.Tk):
             site_factor,
             k_defect,
             wind_to_failure,
-        )
-        rw_x, rw_y, crit_rw, crit_wall = build_sf_vs_residual_wall_curve(
-            sp,
-            dbh,
-            height,
-            crown,
-            wind,
-            fullness_override,
-            site_factor,
-            k_defect,
-        )
-        red_x, red_y = build_sf_vs_crown_reduction_curve(
-            sp,
-            dbh,
-            height,
-            crown,
-            wind,
-            cavity,
-            fullness_override,
-            site_factor,
-            k_defect,
             crown_red_base,
             fullness_red,
         )
+        sf_wind_x, sf_wind_y = sf_wind["x"], sf_wind["y"]
+        rw_x, rw_y = sf_wall["x"], sf_wall["y"]
+        crit_rw, crit_wall = sf_wall["critical_rw"], sf_wall["critical_wall_cm"]
+        red_x, red_y = sf_red["x"], sf_red["y"]
 
-        tree_label = self.tree_label_var.get().strip() or "Tree 1"
-        site_location = self.site_location_var.get().strip()
+        tree_label = snap["tree_label"].strip() or "Tree 1"
+        site_location = snap["site_location"].strip()
 
         # Prepare dictionaries to feed into the existing Word-report builder
         inputs = {
@@ -391,12 +434,12 @@ class AusTreeCalcGUI(tk.Tk):
             "site_factor": site_factor,
         }
         defects = {
-            "bracket_fungi": self.def_bracket_var.get(),
-            "cavity_decay": self.def_cavity_decay_var.get(),
-            "cracks": self.def_cracks_var.get(),
-            "basal_decay": self.def_basal_var.get(),
-            "union": self.def_union_var.get(),
-            "other": self.def_other_var.get().strip(),
+            "bracket_fungi": snap["def_bracket"],
+            "cavity_decay": snap["def_cavity_decay"],
+            "cracks": snap["def_cracks"],
+            "basal_decay": snap["def_basal"],
+            "union": snap["def_union"],
+            "other": snap["def_other"].strip(),
             "strength_factor_k_defect": k_defect,
         }
         res_wall_frac = residual_wall_fraction(dbh, cavity)
@@ -412,51 +455,82 @@ class AusTreeCalcGUI(tk.Tk):
             "sf_vs_crown_reduction": {"x": red_x, "y": red_y},
         }
 
-        script_dir = Path(__file__).resolve().parent
-        output_doc = script_dir / "aus_tree_calc_report_gui.docx"
-
-        build_word_report_from_python(
-            output_doc,
-            tree_label,
-            sp,
-            site_location,
-            inputs,
-            defects,
-            result,
-            wind_to_failure,
-            decay_info,
-            graphs,
+        output_doc = _SCRIPT_DIR / "aus_tree_calc_report_gui.docx"
+
+        # Build the Word report off the Tk mainloop thread; docx/matplotlib
+        # work would otherwise freeze the window for its duration. The Run
+        # button stays disabled until _report_done/_report_failed.
+        self.run_btn.state(["disabled"])
+        self._report_thread = threading.Thread(
+            target=self._write_report,
+            args=(
+                output_doc,
+                tree_label,
+                sp,
+                site_location,
+                inputs,
+                defects,
+                result,
+                wind_to_failure,
+                decay_info,
+                graphs,
+            ),
+            daemon=True,
         )
+        self._report_thread.start()
 
-        # Update output text
-        self.output_text.delete("1.0", tk.END)
-        self._append_output(f"Tree: {tree_label} ({sp.name})")
+        # Update output text in one bulk insert (one layout pass, one scroll)
+        lines = [f"Tree: {tree_label} ({sp.name})"]
         if site_location:
-            self._append_output(f"Location: {site_location}")
-        self._append_output(
+            lines.append(f"Location: {site_location}")
+        lines.append(
             f"Safety factor SF at design wind: "
             f"{result.safety_factor:.2f}" if math.isfinite(result.safety_factor) else "SF: ∞"
         )
-        self._append_output(f"Bending stress: {result.bending_stress_mpa:.2f} MPa")
+        lines.append(f"Bending stress: {result.bending_stress_mpa:.2f} MPa")
         if wind_to_failure is not None and math.isfinite(wind_to_failure):
-            self._append_output(
+            lines.append(
                 f"Estimated wind-to-failure (SF ≈ 1): {wind_to_failure:.1f} m/s"
             )
-        self._append_output(
+        lines.append(
             f"Current residual wall: {res_wall_pct:.0f}% of diameter"
         )
         if crit_rw is not None and crit_wall is not None:
-            self._append_output(
+            lines.append(
                 "SF ≈ 1 at residual wall ≈ "
                 f"{crit_rw:.0f}% (≈ {crit_wall:.1f} cm on each side)"
             )
-        self._append_output("")
+        lines.append("")
+        lines.append(f"Writing Word report to: {output_doc} ...")
+        self.output_text.delete("1.0", tk.END)
+        self.output_text.insert(tk.END, "\n".join(lines) + "\n")
+        self.output_text.see(tk.END)
+
+    def _write_report(self, output_doc: Path, *report_args) -> None:
+        """Worker-thread body: build the docx, then notify on the mainloop."""
+        try:
+            build_word_report_from_python(output_doc, *report_args)
+        except Exception as exc:  # surface worker failures in the UI
+            self.after(0, lambda: self._report_failed(output_doc, exc))
+            return
+        self.after(0, lambda: self._report_done(output_doc))
+
+    def _report_done(self, output_doc: Path) -> None:
+        self.run_btn.state(["!disabled"])
         self._append_output(f"Word report written to: {output_doc}")
         messagebox.showinfo(
             "AusTreeCalc",
             f"Calculation complete. Word report written to:\n{output_doc}",
         )
 
+    def _report_failed(self, output_doc: Path, exc: Exception) -> None:
+        self.run_btn.state(["!disabled"])
+        self._append_output(f"Failed to write Word report: {exc}")
+        messagebox.showerror(
+            "AusTreeCalc",
+            f"Could not write Word report to:\n{output_doc}\n\n{exc}",
+        )
+
 
 def main(argv: list[str]) -> int:  # noqa: D401
     """Run the AusTreeCalc GUI application."""
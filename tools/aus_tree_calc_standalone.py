@@ -15,27 +15,92 @@ Usage (from project root):
     pip3 install -r requirements.txt   # one-time
     python3 tools/aus_tree_calc_standalone.py
 
+or non-interactively, with all inputs in a JSON file:
+
+    python3 tools/aus_tree_calc_standalone.py --config inputs.json
+
 The report will be written next to this script as
 `aus_tree_calc_report.docx` by default.
 """
 
 from __future__ import annotations
 
+import argparse
+import functools
 import json
 import math
+import os
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from io import BytesIO
 from pathlib import Path
 from typing import List, Tuple
 
-import matplotlib.pyplot as plt
-from docx import Document
-from docx.shared import Inches
+_plt = None
+
+
+def _import_plt():
+    """Import matplotlib lazily; only report building needs it.
+
+    Selects the Agg backend on first use — the engine only ever writes
+    PNGs and must not pull in a GUI event loop.
+    """
+    global _plt
+    if _plt is None:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        # Let Agg thin long paths in C instead of rasterizing every segment.
+        plt.rcParams["path.simplify"] = True
+        plt.rcParams["agg.path.chunksize"] = 10000
+        _plt = plt
+    return _plt
+
+
+try:  # Numba is optional: JIT the numeric cores when it is installed.
+    from numba import njit as _njit
+except ImportError:  # pragma: no cover - plain-Python fallback
+
+    def _njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(fn):
+            return fn
+
+        return wrap
+
+
+try:  # orjson is optional: C-accelerated dumps, returns bytes directly
+    import orjson
+
+    def _dumps_indented(obj) -> bytes:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+except ImportError:  # pragma: no cover - stdlib fallback
+
+    def _default(obj):
+        tolist = getattr(obj, "tolist", None)
+        if tolist is not None:  # ndarray (and numpy scalars)
+            return tolist()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def _dumps_indented(obj) -> bytes:
+        return json.dumps(obj, indent=2, default=_default).encode("utf-8")
+
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 AIR_DENSITY = 1.2  # kg/m3
+HALF_RHO = 0.5 * AIR_DENSITY
+PI_OVER_32 = math.pi / 32.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SpeciesPreset:
     id: str
     name: str
@@ -43,6 +108,14 @@ class SpeciesPreset:
     drag_coefficient: float
     crown_shape_factor: float
     default_fullness: float
+    # Drag and crown-shape factors only ever appear multiplied together in
+    # the wind-force term; precompute the product once per preset.
+    cd_x_shape: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "cd_x_shape", self.drag_coefficient * self.crown_shape_factor
+        )
 
 
 SPECIES_PRESETS: List[SpeciesPreset] = [
@@ -105,7 +178,12 @@ SPECIES_PRESETS: List[SpeciesPreset] = [
 ]
 
 
-@dataclass
+SPECIES_BY_ID: dict[str, SpeciesPreset] = {sp.id: sp for sp in SPECIES_PRESETS}
+SPECIES_IDS: Tuple[str, ...] = tuple(sp.id for sp in SPECIES_PRESETS)
+SPECIES_NAME_BY_ID: dict[str, str] = {sp.id: sp.name for sp in SPECIES_PRESETS}
+
+
+@dataclass(frozen=True, slots=True)
 class CalcResult:
     safety_factor: float
     bending_stress_mpa: float
@@ -176,6 +254,24 @@ def choose_species() -> SpeciesPreset:
         print("Please choose a valid number.")
 
 
+# Strength penalties per defect flag: bracket fungi, cavity decay, cracks,
+# basal decay, compromised unions. All 32 flag combinations are precomputed
+# (clamped to [0.3, 1.0]) so the factor is a single table lookup.
+_DEFECT_PENALTIES = (0.8, 0.8, 0.9, 0.8, 0.9)
+_K_TABLE = tuple(
+    max(
+        0.3,
+        min(
+            1.0,
+            math.prod(
+                p for i, p in enumerate(_DEFECT_PENALTIES) if mask >> i & 1
+            ),
+        ),
+    )
+    for mask in range(32)
+)
+
+
 def compute_defect_strength_factor(
     bracket_fungi: bool,
     cavity_decay: bool,
@@ -183,22 +279,14 @@ def compute_defect_strength_factor(
     basal_decay: bool,
     union: bool,
 ) -> float:
-    k = 1.0
-    if bracket_fungi:
-        k *= 0.8
-    if cavity_decay:
-        k *= 0.8
-    if cracks:
-        k *= 0.9
-    if basal_decay:
-        k *= 0.8
-    if union:
-        k *= 0.9
-    if k < 0.3:
-        k = 0.3
-    if k > 1.0:
-        k = 1.0
-    return k
+    mask = (
+        bool(bracket_fungi)
+        | bool(cavity_decay) << 1
+        | bool(cracks) << 2
+        | bool(basal_decay) << 3
+        | bool(union) << 4
+    )
+    return _K_TABLE[mask]
 
 
 def calculate_single(
@@ -212,51 +300,25 @@ def calculate_single(
     site_factor: float,
     k_defect: float,
 ) -> CalcResult:
-    dbh_m = dbh_cm / 100.0
-    d_outer = dbh_m
-    d_inner = 0.0
-    if cavity_inner_cm is not None and cavity_inner_cm > 0:
-        cav = cavity_inner_cm
-        if cav >= dbh_cm:
-            cav = dbh_cm * 0.99
-        d_inner = cav / 100.0
-
-    V = design_wind_ms
-    q = site_factor * 0.5 * AIR_DENSITY * V * V
-
-    radius_crown = crown_diameter_m / 2.0
-    a_plan = math.pi * radius_crown * radius_crown
-
-    fullness_base = fullness_override if fullness_override is not None else species.default_fullness
-    fullness = max(0.1, min(1.0, fullness_base))
-    area = a_plan * species.crown_shape_factor * fullness
-
-    wind_force = q * species.drag_coefficient * area
-    h_eff = 0.66 * height_m
-    m_wind = wind_force * h_eff
-
-    if d_inner > 0.0:
-        W = math.pi * (d_outer**4 - d_inner**4) / (32.0 * d_outer)
-    else:
-        W = math.pi * d_outer**3 / 32.0
-
-    sigma_pa = m_wind / W
-    sigma_mpa = sigma_pa / 1e6
-
-    effective_fb = species.fb_green_mpa * k_defect
-    sf = effective_fb / sigma_mpa if sigma_mpa > 0 else float("inf")
-
-    return CalcResult(
-        safety_factor=sf,
-        bending_stress_mpa=sigma_mpa,
-        q_pa=q,
-        wind_force_n=wind_force,
-        bending_moment_nm=m_wind,
+    # The curve builders sweep one axis while holding the rest of the inputs
+    # fixed, so identical argument tuples recur within (and across) runs.
+    # Memoize on the species id plus the plain-float inputs.
+    return _calculate_single_cached(
+        species.id,
+        dbh_cm,
+        height_m,
+        crown_diameter_m,
+        design_wind_ms,
+        cavity_inner_cm,
+        fullness_override,
+        site_factor,
+        k_defect,
     )
 
 
-def estimate_wind_to_failure(
-    species: SpeciesPreset,
+@functools.lru_cache(maxsize=4096)
+def _calculate_single_cached(
+    species_id: str,
     dbh_cm: float,
     height_m: float,
     crown_diameter_m: float,
@@ -265,34 +327,136 @@ def estimate_wind_to_failure(
     fullness_override: float | None,
     site_factor: float,
     k_defect: float,
-) -> float | None:
-    ref = calculate_single(
-        species,
+) -> CalcResult:
+    species = SPECIES_BY_ID[species_id]
+    # fullness_override is clamped to [0.1, 1.0] where it enters the
+    # program (GUI input collection and _validate_inputs), and species
+    # defaults are in range by construction — no re-clamp per call.
+    fullness = fullness_override if fullness_override is not None else species.default_fullness
+    d_inner_m, _ = _normalize_cavity(dbh_cm, cavity_inner_cm)
+    sf, sigma_mpa, q, wind_force, m_wind = _calc_core(
+        species.fb_green_mpa,
+        species.cd_x_shape,
         dbh_cm,
         height_m,
         crown_diameter_m,
         design_wind_ms,
-        cavity_inner_cm,
-        fullness_override,
+        d_inner_m,
+        fullness,
         site_factor,
         k_defect,
     )
-    sf = ref.safety_factor
+    return CalcResult(
+        safety_factor=sf,
+        bending_stress_mpa=sigma_mpa,
+        q_pa=q,
+        wind_force_n=wind_force,
+        bending_moment_nm=m_wind,
+    )
+
+
+@_njit(cache=True)
+def _calc_core(
+    fb_green_mpa: float,
+    cd_x_shape: float,
+    dbh_cm: float,
+    height_m: float,
+    crown_diameter_m: float,
+    V: float,
+    d_inner: float,
+    fullness: float,
+    site_factor: float,
+    k_defect: float,
+):
+    """Pure-float calculation kernel; d_inner <= 0 means no cavity.
+
+    Takes and returns only floats so Numba (when installed) can compile
+    it. ``d_inner`` is the already-normalized inner diameter in metres
+    from :func:`_normalize_cavity`.
+    """
+    d_outer = dbh_cm / 100.0
+
+    q = site_factor * HALF_RHO * V * V
+
+    radius_crown = crown_diameter_m / 2.0
+    a_plan = math.pi * radius_crown * radius_crown
+
+    wind_force = q * cd_x_shape * a_plan * fullness
+    h_eff = 0.66 * height_m
+    m_wind = wind_force * h_eff
+
+    # Explicit multiply chains avoid float.__pow__ dispatch in the kernel.
+    if d_inner > 0.0:
+        do2 = d_outer * d_outer
+        di2 = d_inner * d_inner
+        W = PI_OVER_32 * (do2 * do2 - di2 * di2) / d_outer
+    else:
+        W = PI_OVER_32 * d_outer * d_outer * d_outer
+
+    sigma_mpa = (m_wind / W) / 1e6
+
+    effective_fb = fb_green_mpa * k_defect
+    sf = effective_fb / sigma_mpa if sigma_mpa > 0 else math.inf
+    return sf, sigma_mpa, q, wind_force, m_wind
+
+
+def estimate_wind_to_failure(result: CalcResult, design_wind_ms: float) -> float | None:
+    """Wind speed at which SF reaches 1, from an already-computed result."""
+    sf = result.safety_factor
     if not math.isfinite(sf) or sf <= 0:
         return None
+    return _wind_to_failure_core(design_wind_ms, sf)
+
+
+@_njit(cache=True)
+def _wind_to_failure_core(design_wind_ms: float, sf: float) -> float:
+    # SF scales with 1/V^2, so the SF = 1 wind speed inverts in closed form.
     return design_wind_ms * math.sqrt(sf)
 
 
-def residual_wall_fraction(dbh_cm: float, cavity_inner_cm: float | None) -> float:
-    if dbh_cm <= 0:
-        return 1.0
-    if cavity_inner_cm is None or cavity_inner_cm <= 0:
-        return 1.0
+def _normalize_cavity(dbh_cm: float, cavity_inner_cm: float | None) -> Tuple[float, float]:
+    """Normalize a cavity input to ``(d_inner_m, residual_wall_fraction)``.
+
+    Single home for the cavity handling: None or non-positive means no
+    cavity, and a cavity at or beyond the outer diameter clamps to
+    0.99 * dbh. Every consumer (the calculation kernel, the residual-wall
+    readout and the section modulus) derives from this, so the numbers
+    stay consistent by construction.
+    """
+    if dbh_cm <= 0 or cavity_inner_cm is None or cavity_inner_cm <= 0:
+        return 0.0, 1.0
     cav = cavity_inner_cm
     if cav >= dbh_cm:
         cav = dbh_cm * 0.99
     frac = (dbh_cm - cav) / dbh_cm
-    return max(0.0, min(1.0, frac))
+    return cav / 100.0, max(0.0, min(1.0, frac))
+
+
+def residual_wall_fraction(dbh_cm: float, cavity_inner_cm: float | None) -> float:
+    return _normalize_cavity(dbh_cm, cavity_inner_cm)[1]
+
+
+def residual_wall_fraction_arr(dbh_cm: float, cavity_arr):
+    """Vectorized residual_wall_fraction over an array of cavity diameters (cm)."""
+    import numpy as np
+
+    cav = np.asarray(cavity_arr, dtype=float)
+    if dbh_cm <= 0:
+        return np.ones_like(cav)
+    clamped = np.minimum(cav, dbh_cm * 0.99)
+    frac = np.where(clamped <= 0, 1.0, (dbh_cm - clamped) / dbh_cm)
+    return np.clip(frac, 0.0, 1.0)
+
+
+def _section_modulus(dbh_cm: float, cavity_inner_cm: float | None) -> float:
+    """Stem section modulus (m^3), with the same cavity clamp as calculate_single."""
+    d_outer = dbh_cm / 100.0
+    d_inner, _ = _normalize_cavity(dbh_cm, cavity_inner_cm)
+    if d_inner > 0.0:
+        do2 = d_outer * d_outer
+        di2 = d_inner * d_inner
+        return PI_OVER_32 * (do2 * do2 - di2 * di2) / d_outer
+    return PI_OVER_32 * d_outer * d_outer * d_outer
 
 
 def build_sf_vs_wind_curve(
@@ -317,25 +481,29 @@ def build_sf_vs_wind_curve(
             max_v = extended
     if max_v <= min_v:
         max_v = min_v + 5.0
-    xs: List[float] = []
-    ys: List[float] = []
     steps = 12
-    for i in range(steps):
-        v = min_v + (max_v - min_v) * i / (steps - 1)
-        res = calculate_single(
-            species,
-            dbh_cm,
-            height_m,
-            crown_diameter_m,
-            v,
-            cavity_inner_cm,
-            fullness_override,
-            site_factor,
-            k_defect,
-        )
-        xs.append(v)
-        ys.append(res.safety_factor)
-    return xs, ys
+    import numpy as np
+
+    # SF is an exact closed form of V: loading scales with V^2 while the
+    # section modulus and effective strength are V-independent, so one
+    # reference evaluation at the design wind yields the whole curve.
+    vs = np.linspace(min_v, max_v, steps)
+    ref = calculate_single(
+        species,
+        dbh_cm,
+        height_m,
+        crown_diameter_m,
+        design_wind_ms,
+        cavity_inner_cm,
+        fullness_override,
+        site_factor,
+        k_defect,
+    )
+    sf_ref = ref.safety_factor
+    if not math.isfinite(sf_ref):
+        return vs.tolist(), [sf_ref] * steps
+    ys = sf_ref * (design_wind_ms / vs) ** 2
+    return vs.tolist(), ys.tolist()
 
 
 def build_sf_vs_residual_wall_curve(
@@ -348,41 +516,40 @@ def build_sf_vs_residual_wall_curve(
     site_factor: float,
     k_defect: float,
 ) -> Tuple[List[float], List[float], float | None, float | None]:
-    xs: List[float] = []
-    ys: List[float] = []
     rw_min, rw_max = 20.0, 100.0
     steps = 9
-    for i in range(steps):
-        rw = rw_min + (rw_max - rw_min) * i / (steps - 1)
-        frac = rw / 100.0
-        cav_cm = dbh_cm * (1.0 - frac)
-        cavity_sim = cav_cm if cav_cm > 0 else None
-        res = calculate_single(
-            species,
-            dbh_cm,
-            height_m,
-            crown_diameter_m,
-            design_wind_ms,
-            cavity_sim,
-            fullness_override,
-            site_factor,
-            k_defect,
-        )
-        xs.append(rw)
-        ys.append(res.safety_factor)
-
-    critical_rw: float | None = None
-    if len(xs) >= 2:
-        for i in range(len(xs) - 1):
-            y1, y2 = ys[i], ys[i + 1]
-            if not (math.isfinite(y1) and math.isfinite(y2)):
-                continue
-            if (y1 >= 1.0 and y2 <= 1.0) or (y1 <= 1.0 and y2 >= 1.0):
-                x1, x2 = xs[i], xs[i + 1]
-                t = (1.0 - y1) / (y2 - y1) if y2 != y1 else 0.0
-                x = x1 + (x2 - x1) * t
-                critical_rw = max(rw_min, min(rw_max, x))
-                break
+    import numpy as np
+
+    # Only the section modulus varies across the sweep; wind loading and
+    # effective strength are constant, so compute them once and broadcast
+    # the residual-wall axis with NumPy.
+    ref = calculate_single(
+        species,
+        dbh_cm,
+        height_m,
+        crown_diameter_m,
+        design_wind_ms,
+        None,
+        fullness_override,
+        site_factor,
+        k_defect,
+    )
+    m_wind = ref.bending_moment_nm
+    effective_fb = species.fb_green_mpa * k_defect
+
+    rw_arr = np.linspace(rw_min, rw_max, steps)
+    d_outer = dbh_cm / 100.0
+    cav_arr = dbh_cm * (1.0 - rw_arr / 100.0)
+    d_inner = dbh_cm * (1.0 - residual_wall_fraction_arr(dbh_cm, cav_arr)) / 100.0
+    W = np.pi * (d_outer**4 - d_inner**4) / (32.0 * d_outer)
+    sigma_mpa = (m_wind / W) / 1e6
+    with np.errstate(divide="ignore"):
+        sf = np.where(sigma_mpa > 0, effective_fb / sigma_mpa, np.inf)
+
+    xs: List[float] = rw_arr.tolist()
+    ys: List[float] = sf.tolist()
+
+    critical_rw = _critical_residual_wall(dbh_cm, m_wind, effective_fb, rw_min, rw_max)
 
     critical_wall_cm: float | None = None
     if critical_rw is not None:
@@ -391,6 +558,36 @@ def build_sf_vs_residual_wall_curve(
     return xs, ys, critical_rw, critical_wall_cm
 
 
+def _critical_residual_wall(
+    dbh_cm: float,
+    m_wind_nm: float,
+    effective_fb_mpa: float,
+    rw_min: float = 20.0,
+    rw_max: float = 100.0,
+) -> float | None:
+    """Residual-wall percentage where SF = 1, by analytic inversion.
+
+    SF(rw) = effective_fb * W(rw) / m_wind and W has a closed form in the
+    inner diameter, so solve W(rw) = m_wind / (effective_fb * 1e6) for rw
+    directly instead of sampling the curve and interpolating. Returns
+    None when the crossing falls outside [rw_min, rw_max] (including the
+    case where even a solid stem sits below SF = 1).
+    """
+    if dbh_cm <= 0 or m_wind_nm <= 0 or effective_fb_mpa <= 0:
+        return None
+    d_outer = dbh_cm / 100.0
+    target_w = m_wind_nm / (effective_fb_mpa * 1e6)
+    do2 = d_outer * d_outer
+    radicand = do2 * do2 - 32.0 * d_outer * target_w / math.pi
+    if radicand <= 0.0:
+        return None
+    d_inner = radicand**0.25
+    rw = 100.0 * (1.0 - d_inner / d_outer)
+    if rw < rw_min or rw > rw_max:
+        return None
+    return rw
+
+
 def build_sf_vs_crown_reduction_curve(
     species: SpeciesPreset,
     dbh_cm: float,
@@ -404,38 +601,133 @@ def build_sf_vs_crown_reduction_curve(
     base_reduction_percent: float,
     fullness_reduction_percent: float,
 ) -> Tuple[List[float], List[float]]:
-    xs: List[float] = []
-    ys: List[float] = []
     max_red = max(5.0, min(40.0, base_reduction_percent or 20.0))
     steps = 9
     fullness_base = (
         fullness_override if fullness_override is not None else species.default_fullness
     )
-    for i in range(steps):
-        r = max_red * i / (steps - 1)
-        crown_after = crown_diameter_m * (1.0 - r / 100.0)
-        fullness_after_raw = fullness_base * (1.0 - fullness_reduction_percent / 100.0)
-        fullness_after = max(0.1, min(1.0, fullness_after_raw))
-        res = calculate_single(
-            species,
-            dbh_cm,
-            height_m,
-            crown_after,
-            design_wind_ms,
-            cavity_inner_cm,
-            fullness_after,
-            site_factor,
-            k_defect,
-        )
-        xs.append(r)
-        ys.append(res.safety_factor)
-    return xs, ys
+    fullness_after_raw = fullness_base * (1.0 - fullness_reduction_percent / 100.0)
+    fullness_after = max(0.1, min(1.0, fullness_after_raw))
+    import numpy as np
+
+    # Crown area scales with (1 - r/100)^2 and is the only r-dependent
+    # term (fullness_after is independent of r), so one reference
+    # evaluation at r = 0 gives the whole curve in closed form.
+    ref = calculate_single(
+        species,
+        dbh_cm,
+        height_m,
+        crown_diameter_m,
+        design_wind_ms,
+        cavity_inner_cm,
+        fullness_after,
+        site_factor,
+        k_defect,
+    )
+    sf_at_r0 = ref.safety_factor
+    r = np.linspace(0.0, max_red, steps)
+    if not math.isfinite(sf_at_r0):
+        return r.tolist(), [sf_at_r0] * steps
+    scale = (1.0 - r / 100.0) ** 2
+    sf = sf_at_r0 / scale
+    return r.tolist(), sf.tolist()
 
 
-def plot_sf_curve(x, y, xlabel: str, ylabel: str, title: str, out_path: Path) -> None:
-    if not x or not y or len(x) != len(y):
-        return
-    fig, ax = plt.subplots(figsize=(5, 3))
+def build_all_curves(
+    species: SpeciesPreset,
+    dbh_cm: float,
+    height_m: float,
+    crown_diameter_m: float,
+    design_wind_ms: float,
+    cavity_inner_cm: float | None,
+    fullness_override: float | None,
+    site_factor: float,
+    k_defect: float,
+    wind_to_failure: float | None,
+    base_reduction_percent: float,
+    fullness_reduction_percent: float,
+) -> Tuple[dict, dict, dict]:
+    """Build all three SF curves in one pass.
+
+    The three per-curve builders each recompute the same crown area, base
+    bending moment and species constants; here those shared terms are
+    evaluated once and the three sweep axes are broadcast against them.
+    Returns ``(sf_wind, sf_wall, sf_red)`` dicts, each with ``x``/``y``
+    ndarrays (matplotlib plots them natively and orjson serializes them
+    via ``OPT_SERIALIZE_NUMPY``, so no list copies are made); ``sf_wall``
+    additionally carries ``critical_rw`` and ``critical_wall_cm``.
+    """
+    import numpy as np
+
+    # Shared, sweep-independent terms.
+    radius_crown = crown_diameter_m / 2.0
+    a_plan = math.pi * radius_crown * radius_crown
+    fullness_base = (
+        fullness_override if fullness_override is not None else species.default_fullness
+    )
+    fullness = max(0.1, min(1.0, fullness_base))
+    h_eff = 0.66 * height_m
+    q_design = site_factor * HALF_RHO * design_wind_ms * design_wind_ms
+    m_wind_design = q_design * species.cd_x_shape * a_plan * fullness * h_eff
+    W = _section_modulus(dbh_cm, cavity_inner_cm)
+    effective_fb = species.fb_green_mpa * k_defect
+
+    sf_wind: dict = {"x": [], "y": []}
+    if design_wind_ms > 0:
+        min_v = max(5.0, design_wind_ms * 0.5)
+        max_v = design_wind_ms * 1.8
+        if wind_to_failure is not None and math.isfinite(wind_to_failure) and wind_to_failure > 0:
+            max_v = max(max_v, wind_to_failure * 1.1)
+        if max_v <= min_v:
+            max_v = min_v + 5.0
+        vs = np.linspace(min_v, max_v, 12)
+        m_wind = m_wind_design * (vs / design_wind_ms) ** 2
+        sigma_mpa = (m_wind / W) / 1e6
+        with np.errstate(divide="ignore"):
+            sf = np.where(sigma_mpa > 0, effective_fb / sigma_mpa, np.inf)
+        sf_wind = {"x": vs, "y": sf}
+
+    # Residual-wall sweep: only the section modulus changes.
+    rw_min, rw_max = 20.0, 100.0
+    rw_arr = np.linspace(rw_min, rw_max, 9)
+    d_outer = dbh_cm / 100.0
+    cav_arr = dbh_cm * (1.0 - rw_arr / 100.0)
+    d_inner = dbh_cm * (1.0 - residual_wall_fraction_arr(dbh_cm, cav_arr)) / 100.0
+    W_rw = np.pi * (d_outer**4 - d_inner**4) / (32.0 * d_outer)
+    sigma_rw = (m_wind_design / W_rw) / 1e6
+    with np.errstate(divide="ignore"):
+        sf_rw = np.where(sigma_rw > 0, effective_fb / sigma_rw, np.inf)
+    critical_rw = _critical_residual_wall(
+        dbh_cm, m_wind_design, effective_fb, rw_min, rw_max
+    )
+    critical_wall_cm = (
+        dbh_cm * (critical_rw / 100.0) / 2.0 if critical_rw is not None else None
+    )
+    sf_wall = {
+        "x": rw_arr,
+        "y": sf_rw,
+        "critical_rw": critical_rw,
+        "critical_wall_cm": critical_wall_cm,
+    }
+
+    # Crown-reduction sweep: the bending moment scales with the reduced
+    # crown area and fullness; everything else is the design-wind state.
+    max_red = max(5.0, min(40.0, base_reduction_percent or 20.0))
+    fullness_after = max(
+        0.1, min(1.0, fullness_base * (1.0 - fullness_reduction_percent / 100.0))
+    )
+    r = np.linspace(0.0, max_red, 9)
+    moment_scale = (fullness_after / fullness) * (1.0 - r / 100.0) ** 2
+    sigma_red = (m_wind_design * moment_scale / W) / 1e6
+    with np.errstate(divide="ignore"):
+        sf_red_arr = np.where(sigma_red > 0, effective_fb / sigma_red, np.inf)
+    sf_red = {"x": r, "y": sf_red_arr}
+
+    return sf_wind, sf_wall, sf_red
+
+
+def _draw_sf_curve(ax, x, y, xlabel: str, ylabel: str, title: str) -> None:
+    ax.clear()
     ax.plot(x, y, marker="o")
     ax.set_title(title)
     ax.set_xlabel(xlabel)
@@ -443,8 +735,17 @@ def plot_sf_curve(x, y, xlabel: str, ylabel: str, title: str, out_path: Path) ->
     ax.grid(True, linestyle="--", alpha=0.4)
     for level in (1.0, 1.5):
         ax.axhline(level, color="grey", linestyle=":", linewidth=0.8)
+
+
+def plot_sf_curve(x, y, xlabel: str, ylabel: str, title: str, out) -> None:
+    """Plot an SF curve to ``out`` (a path or a file-like such as BytesIO)."""
+    if x is None or y is None or len(x) == 0 or len(x) != len(y):
+        return
+    plt = _import_plt()
+    fig, ax = plt.subplots(figsize=(5, 3))
+    _draw_sf_curve(ax, x, y, xlabel, ylabel, title)
     fig.tight_layout()
-    fig.savefig(out_path, dpi=150)
+    fig.savefig(out, format="png", dpi=150)
     plt.close(fig)
 
 
@@ -460,6 +761,9 @@ def build_word_report_from_python(
     decay_info: dict,
     graphs: dict,
 ) -> None:
+    from docx import Document
+    from docx.shared import Inches
+
     doc = Document()
 
     doc.add_heading(tree_label or "AusTreeCalc tree stability report", level=0)
@@ -549,87 +853,199 @@ def build_word_report_from_python(
             f"about {crit:.0f}% of diameter (≈ {crit_wall:.1f} cm on each side)."
         )
 
-    # Graphs
+    # Graphs (rendered straight into memory; no temp PNGs on disk)
     doc.add_heading("Graphs", level=1)
-    image_dir = output_path.parent
-    image_dir.mkdir(parents=True, exist_ok=True)
 
     fig_counter = 1
+    buf = BytesIO()
+    # One figure/axes pair reused for all three graphs; per-figure
+    # construction (canvas, font caches) is paid only once.
+    plt = _import_plt()
+    fig, ax = plt.subplots(figsize=(5, 3))
 
-    def add_curve_graph(key: str, xlabel: str, title: str, filename: str) -> None:
+    def add_curve_graph(key: str, xlabel: str, title: str) -> None:
         nonlocal fig_counter
         g = graphs.get(key) or {}
-        xs = g.get("x") or []
-        ys = g.get("y") or []
-        if not xs or not ys:
+        xs = g.get("x")
+        ys = g.get("y")
+        # len() checks rather than truthiness: xs/ys may be ndarrays.
+        if xs is None or ys is None or len(xs) == 0 or len(ys) == 0:
             return
-        img_path = image_dir / filename
-        plot_sf_curve(xs, ys, xlabel, "SF", title, img_path)
+        _draw_sf_curve(ax, xs, ys, xlabel, "SF", title)
+        fig.tight_layout()
+        buf.seek(0)
+        buf.truncate(0)
+        fig.savefig(buf, format="png", dpi=150)
+        buf.seek(0)
         doc.add_paragraph(
             f"Figure {fig_counter} – {title}")
-        doc.add_picture(str(img_path), width=Inches(5.0))
+        doc.add_picture(buf, width=Inches(5.0))
         fig_counter += 1
 
-    add_curve_graph("sf_vs_wind", "Wind speed (m/s)", "Safety factor versus wind speed",
-                    "figure_sf_vs_wind.png")
+    add_curve_graph("sf_vs_wind", "Wind speed (m/s)", "Safety factor versus wind speed")
     add_curve_graph(
         "sf_vs_residual_wall",
         "Residual wall (% of diameter)",
         "Safety factor versus residual wall thickness",
-        "figure_sf_vs_residual_wall.png",
     )
     add_curve_graph(
         "sf_vs_crown_reduction",
         "Crown reduction (%)",
         "Safety factor versus crown reduction (%)",
-        "figure_sf_vs_crown_reduction.png",
     )
+    plt.close(fig)
 
     doc.save(str(output_path))
 
 
-def main(argv: List[str]) -> int:
+def _validate_inputs(config: dict) -> dict:
+    """Validate and normalize a raw config dict into ``run_pipeline`` inputs.
+
+    All problems are collected and reported in one ValueError rather than
+    failing on the first bad field, mirroring the batched validation in
+    the GUI.
+    """
+    errors: List[str] = []
+    out: dict = {}
+
+    species_id = config.get("species_id", "euc_typical")
+    species = SPECIES_BY_ID.get(species_id)
+    if species is None:
+        errors.append(f"unknown species_id {species_id!r} (expected one of {', '.join(SPECIES_IDS)})")
+    out["species"] = species
+
+    out["tree_label"] = str(config.get("tree_label") or "Tree 1")
+    out["site_location"] = str(config.get("site_location") or "")
+
+    for key, default, positive in (
+        ("dbh_cm", 50.0, True),
+        ("height_m", 18.0, True),
+        ("crown_diameter_m", 10.0, True),
+        ("design_wind_ms", 40.0, True),
+        ("site_factor", 1.0, True),
+        ("crown_reduction_percent", 20.0, False),
+        ("fullness_reduction_percent", 30.0, False),
+    ):
+        raw = config.get(key, default)
+        try:
+            val = float(raw)
+        except (TypeError, ValueError):
+            errors.append(f"{key} must be a number, got {raw!r}")
+            continue
+        if positive and val <= 0:
+            errors.append(f"{key} must be positive, got {val}")
+        out[key] = val
+
+    cavity = config.get("cavity_inner_cm")
+    if cavity is not None:
+        try:
+            cavity = float(cavity)
+        except (TypeError, ValueError):
+            errors.append(f"cavity_inner_cm must be a number or null, got {cavity!r}")
+            cavity = None
+    out["cavity_inner_cm"] = cavity
+
+    fullness = config.get("fullness_override")
+    if fullness is not None:
+        try:
+            fullness = max(0.1, min(1.0, float(fullness)))
+        except (TypeError, ValueError):
+            errors.append(f"fullness_override must be a number or null, got {fullness!r}")
+            fullness = None
+    out["fullness_override"] = fullness
+
+    defects = config.get("defects") or {}
+    out["defects"] = {
+        "bracket_fungi": bool(defects.get("bracket_fungi")),
+        "cavity_decay": bool(defects.get("cavity_decay")),
+        "cracks": bool(defects.get("cracks")),
+        "basal_decay": bool(defects.get("basal_decay")),
+        "union": bool(defects.get("union")),
+        "other": str(defects.get("other") or ""),
+    }
+
+    output_docx = config.get("output_docx")
+    out["output_docx"] = Path(output_docx) if output_docx else None
+
+    if errors:
+        raise ValueError("Invalid inputs: " + "; ".join(errors))
+    return out
+
+
+def _collect_inputs_interactive() -> dict:
+    """Prompt for all inputs on stdin and return a raw config dict."""
     print("AusTreeCalc standalone (Python)")
     print("This will ask you for tree details and generate a Word report.\n")
 
-    tree_label = input("Tree label / ID [Tree 1]: ").strip() or "Tree 1"
-    site_location = input("Site / location [optional]: ").strip()
+    config: dict = {}
+    config["tree_label"] = input("Tree label / ID [Tree 1]: ").strip() or "Tree 1"
+    config["site_location"] = input("Site / location [optional]: ").strip()
 
     species = choose_species()
+    config["species_id"] = species.id
 
-    dbh_cm = prompt_float("DBH (cm):", 50.0)
-    height_m = prompt_float("Tree height (m):", 18.0)
-    crown_diameter_m = prompt_float("Crown diameter (m):", 10.0)
-    cavity_inner_cm = prompt_optional_float("Cavity inner diameter (cm)")
+    config["dbh_cm"] = prompt_float("DBH (cm):", 50.0)
+    config["height_m"] = prompt_float("Tree height (m):", 18.0)
+    config["crown_diameter_m"] = prompt_float("Crown diameter (m):", 10.0)
+    config["cavity_inner_cm"] = prompt_optional_float("Cavity inner diameter (cm)")
 
-    design_wind_ms = prompt_float("Design wind speed (m/s):", 40.0)
-    site_factor = prompt_float("Site factor (exposure/topography) 0.5–1.5:", 1.0)
+    config["design_wind_ms"] = prompt_float("Design wind speed (m/s):", 40.0)
+    config["site_factor"] = prompt_float("Site factor (exposure/topography) 0.5–1.5:", 1.0)
 
     use_fullness_override = prompt_yes_no(
         "Override crown fullness (default is species typical)?", False
     )
-    fullness_override = None
-    if use_fullness_override:
-        fullness_override = prompt_float("Crown fullness (0–1):", species.default_fullness)
-        if fullness_override < 0.1:
-            fullness_override = 0.1
-        if fullness_override > 1.0:
-            fullness_override = 1.0
+    config["fullness_override"] = (
+        prompt_float("Crown fullness (0–1):", species.default_fullness)
+        if use_fullness_override
+        else None
+    )
 
     print("\nObserved structural defects / decay indicators:")
-    defect_bracket = prompt_yes_no("  Bracket fungi on stem or base?", False)
-    defect_cavity_decay = prompt_yes_no("  Cavity with visible decay?", False)
-    defect_cracks = prompt_yes_no("  Longitudinal cracks / shear planes?", False)
-    defect_basal = prompt_yes_no("  Basal/root-plate decay symptoms?", False)
-    defect_union = prompt_yes_no("  Included bark / compromised unions?", False)
-    defect_other = input("  Other defect / decay observations (optional): ").strip()
+    config["defects"] = {
+        "bracket_fungi": prompt_yes_no("  Bracket fungi on stem or base?", False),
+        "cavity_decay": prompt_yes_no("  Cavity with visible decay?", False),
+        "cracks": prompt_yes_no("  Longitudinal cracks / shear planes?", False),
+        "basal_decay": prompt_yes_no("  Basal/root-plate decay symptoms?", False),
+        "union": prompt_yes_no("  Included bark / compromised unions?", False),
+        "other": input("  Other defect / decay observations (optional): ").strip(),
+    }
+
+    config["crown_reduction_percent"] = prompt_float(
+        "Typical crown reduction to model (%)", 20.0
+    )
+    config["fullness_reduction_percent"] = prompt_float(
+        "Typical crown thinning effect on fullness (%)", 30.0
+    )
+    return config
+
+
+def run_pipeline(config: dict) -> Path:
+    """Run the full compute + report pipeline for one validated config.
+
+    ``config`` is the dict returned by :func:`_validate_inputs`. Returns
+    the path of the written .docx report.
+    """
+    species: SpeciesPreset = config["species"]
+    tree_label: str = config["tree_label"]
+    site_location: str = config["site_location"]
+    dbh_cm: float = config["dbh_cm"]
+    height_m: float = config["height_m"]
+    crown_diameter_m: float = config["crown_diameter_m"]
+    cavity_inner_cm: float | None = config["cavity_inner_cm"]
+    design_wind_ms: float = config["design_wind_ms"]
+    site_factor: float = config["site_factor"]
+    fullness_override: float | None = config["fullness_override"]
+    defect_flags: dict = config["defects"]
+    crown_red_base: float = config["crown_reduction_percent"]
+    fullness_red: float = config["fullness_reduction_percent"]
 
     k_defect = compute_defect_strength_factor(
-        defect_bracket,
-        defect_cavity_decay,
-        defect_cracks,
-        defect_basal,
-        defect_union,
+        defect_flags["bracket_fungi"],
+        defect_flags["cavity_decay"],
+        defect_flags["cracks"],
+        defect_flags["basal_decay"],
+        defect_flags["union"],
     )
 
     # Main calculation
@@ -645,20 +1061,10 @@ def main(argv: List[str]) -> int:
         k_defect,
     )
 
-    wind_to_failure = estimate_wind_to_failure(
-        species,
-        dbh_cm,
-        height_m,
-        crown_diameter_m,
-        design_wind_ms,
-        cavity_inner_cm,
-        fullness_override,
-        site_factor,
-        k_defect,
-    )
+    wind_to_failure = estimate_wind_to_failure(result, design_wind_ms)
 
-    # Curves
-    sf_wind_x, sf_wind_y = build_sf_vs_wind_curve(
+    # Curves (single fused pass so shared terms are computed once)
+    sf_wind, sf_wall, sf_red = build_all_curves(
         species,
         dbh_cm,
         height_m,
@@ -669,37 +1075,13 @@ def main(argv: List[str]) -> int:
         site_factor,
         k_defect,
         wind_to_failure,
-    )
-
-    rw_x, rw_y, crit_rw, crit_wall = build_sf_vs_residual_wall_curve(
-        species,
-        dbh_cm,
-        height_m,
-        crown_diameter_m,
-        design_wind_ms,
-        fullness_override,
-        site_factor,
-        k_defect,
-    )
-
-    crown_red_base = prompt_float("Typical crown reduction to model (%)", 20.0)
-    fullness_red = prompt_float(
-        "Typical crown thinning effect on fullness (%)", 30.0
-    )
-
-    red_x, red_y = build_sf_vs_crown_reduction_curve(
-        species,
-        dbh_cm,
-        height_m,
-        crown_diameter_m,
-        design_wind_ms,
-        cavity_inner_cm,
-        fullness_override,
-        site_factor,
-        k_defect,
         crown_red_base,
         fullness_red,
     )
+    sf_wind_x, sf_wind_y = sf_wind["x"], sf_wind["y"]
+    rw_x, rw_y = sf_wall["x"], sf_wall["y"]
+    crit_rw, crit_wall = sf_wall["critical_rw"], sf_wall["critical_wall_cm"]
+    red_x, red_y = sf_red["x"], sf_red["y"]
 
     # Simple on-screen summary
     print("\nResults:")
@@ -708,7 +1090,7 @@ def main(argv: List[str]) -> int:
     if wind_to_failure is not None and math.isfinite(wind_to_failure):
         print(f"  Estimated wind-to-failure (SF ≈ 1): {wind_to_failure:.1f} m/s")
 
-    res_wall_frac = residual_wall_fraction(dbh_cm, cavity_inner_cm)
+    _, res_wall_frac = _normalize_cavity(dbh_cm, cavity_inner_cm)
     res_wall_pct = res_wall_frac * 100.0
     print(f"  Current residual wall (from DBH and cavity): {res_wall_pct:.0f}% of diameter")
     if crit_rw is not None and crit_wall is not None:
@@ -717,9 +1099,13 @@ def main(argv: List[str]) -> int:
             f"{crit_rw:.0f}% (≈ {crit_wall:.1f} cm on each side) at design wind."
         )
 
-    # Build Word report with graphs
-    script_dir = Path(__file__).resolve().parent
-    output_doc = script_dir / "aus_tree_calc_report.docx"
+    # Build Word report with graphs. Paths stay plain strings on this
+    # path; per-report pathlib objects buy nothing here.
+    output_doc = config["output_docx"]
+    if output_doc is None:
+        output_doc = os.path.join(_SCRIPT_DIR, "aus_tree_calc_report.docx")
+    else:
+        output_doc = str(output_doc)
 
     inputs = {
         "dbh_cm": dbh_cm,
@@ -729,15 +1115,7 @@ def main(argv: List[str]) -> int:
         "design_wind_speed_ms": design_wind_ms,
         "site_factor": site_factor,
     }
-    defects = {
-        "bracket_fungi": defect_bracket,
-        "cavity_decay": defect_cavity_decay,
-        "cracks": defect_cracks,
-        "basal_decay": defect_basal,
-        "union": defect_union,
-        "other": defect_other,
-        "strength_factor_k_defect": k_defect,
-    }
+    defects = {**defect_flags, "strength_factor_k_defect": k_defect}
     decay_info = {
         "current_residual_percent": res_wall_pct,
         "critical_residual_percent": crit_rw,
@@ -766,7 +1144,7 @@ def main(argv: List[str]) -> int:
     print("You can open this .docx in Word or Pages and edit as needed.")
 
     # Also save raw data as JSON next to the report for reference
-    json_path = output_doc.with_suffix(".json")
+    json_path = os.path.splitext(output_doc)[0] + ".json"
     payload = {
         "tree_label": tree_label,
         "species_id": species.id,
@@ -785,9 +1163,89 @@ def main(argv: List[str]) -> int:
         "decay": decay_info,
         "graphs": graphs,
     }
-    json_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    with open(json_path, "wb") as fh:
+        fh.write(_dumps_indented(payload))
     print(f"Raw calculation data saved to: {json_path}")
 
+    return Path(output_doc)
+
+
+def _run_one(config_path: str | Path) -> Path:
+    """Run the pipeline for one config file (worker for batch mode).
+
+    Must stay a top-level function so it is picklable by multiprocessing.
+    When the config does not name an output, the report is written next
+    to the config file as ``<stem>_report.docx``, so parallel runs never
+    collide and the raw-data JSON (same stem as the report) never
+    overwrites the config itself.
+    """
+    config_path = Path(config_path)
+    raw = json.loads(config_path.read_text(encoding="utf-8"))
+    config = _validate_inputs(raw)
+    if config["output_docx"] is None:
+        config["output_docx"] = config_path.with_name(config_path.stem + "_report.docx")
+    return run_pipeline(config)
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="aus_tree_calc_standalone",
+        description="Compute tree stability and generate a Word report.",
+    )
+    parser.add_argument(
+        "--config",
+        metavar="PATH",
+        help="JSON file with all inputs; skips the interactive prompts",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="DIR",
+        help="directory of config JSON files; one report per file, run in parallel",
+    )
+    parser.add_argument(
+        "--no-interactive",
+        action="store_true",
+        help="fail instead of prompting when --config is missing",
+    )
+    args = parser.parse_args(argv[1:])
+
+    if args.batch:
+        import multiprocessing
+
+        config_paths = sorted(
+            p
+            for p in Path(args.batch).expanduser().glob("*.json")
+            # Each run exports raw data as <stem>_report.json next to the
+            # report; don't re-read those as configs on the next run.
+            if not p.stem.endswith("_report")
+        )
+        if not config_paths:
+            print(f"No .json config files found in {args.batch}", file=sys.stderr)
+            return 1
+        # Each worker renders its own matplotlib figure and docx; the
+        # pipelines are independent, so they parallelize cleanly.
+        with multiprocessing.Pool(min(os.cpu_count() or 1, len(config_paths))) as pool:
+            outputs = pool.map(_run_one, config_paths)
+        print(f"\nWrote {len(outputs)} reports:")
+        for out in outputs:
+            print(f"  {out}")
+        return 0
+
+    if args.config:
+        raw = json.loads(Path(args.config).expanduser().read_text(encoding="utf-8"))
+    elif args.no_interactive:
+        print("--no-interactive requires --config", file=sys.stderr)
+        return 1
+    else:
+        raw = _collect_inputs_interactive()
+
+    try:
+        config = _validate_inputs(raw)
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+
+    run_pipeline(config)
     return 0
 
 
@@ -8,21 +8,172 @@ The JSON file should be created from the Flutter app using the
 "Export JSON for Word" button in the Report card.
 """
 
+from __future__ import annotations
+
 import json
+import math
+import mmap
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
 from pathlib import Path
 
-import matplotlib.pyplot as plt
-from docx import Document
-from docx.shared import Inches
+# matplotlib and docx are imported lazily inside the functions that use
+# them: together they cost several hundred ms of startup, which the
+# usage-error and --help paths should never pay.
+
+try:  # Pillow is optional: a direct line renderer for these simple plots
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:  # pragma: no cover - matplotlib-only without Pillow
+    Image = None
+
+try:  # orjson is optional: SIMD-accelerated parser, takes bytes directly
+    import orjson
+
+    def _loads(raw: bytes):
+        return orjson.loads(raw)
+
+except ImportError:  # pragma: no cover - stdlib fallback
 
+    def _loads(raw):
+        if isinstance(raw, memoryview):  # stdlib json can't take a view
+            raw = raw.tobytes()
+        return json.loads(raw)
 
-def _plot_sf_curve(x, y, xlabel, ylabel, title, out_path: Path):
-    """Create a simple SF curve plot and save as PNG."""
-    if not x or not y or len(x) != len(y):
-        return None
 
-    fig, ax = plt.subplots(figsize=(5, 3))
+try:  # msgpack is optional: compact binary alternative to the JSON export
+    import msgpack
+except ImportError:  # pragma: no cover - JSON-only without the dep
+    msgpack = None
+
+
+def _parse_export(raw) -> dict:
+    """Parse export bytes, sniffing the format from the leading byte.
+
+    JSON exports open with '{' (allowing leading whitespace); anything
+    else is treated as MessagePack, which cuts file size for the float
+    arrays that dominate these exports.
+    """
+    head = bytes(raw[:16]).lstrip()
+    if head[:1] == b"{":
+        return _loads(raw)
+    if msgpack is None:
+        raise ValueError(
+            "Export does not look like JSON and msgpack is not installed"
+        )
+    return msgpack.unpackb(raw, raw=False)
+
+
+# Exports above this size are mmap-ed so parsing reads demand-paged file
+# cache instead of a full heap copy of the file.
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _load_export(json_path: Path) -> dict:
+    """Read and parse the JSON export."""
+    try:
+        if json_path.stat().st_size >= _MMAP_THRESHOLD:
+            with open(json_path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, "madvise"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    view = memoryview(mm)
+                    try:
+                        return _parse_export(view)
+                    finally:
+                        view.release()
+    except (OSError, ValueError):  # pragma: no cover - e.g. empty/special file
+        pass
+    # Whole-file slurp: no point paying for the BufferedReader layer.
+    with open(json_path, "rb", buffering=0) as f:
+        return _parse_export(f.read())
+
+
+def _add_paragraphs_fast(body, lines, style_id=None) -> None:
+    """Append one plain <w:p> per line directly to the document body.
+
+    Bypasses python-docx's add_paragraph, which re-resolves the style and
+    rebuilds object wrappers per call — that dominates when the summary
+    and appendix sections run to hundreds of lines. Paragraphs are
+    inserted before the trailing <w:sectPr> so the body stays valid.
+    """
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+
+    sect_pr = body.find(qn("w:sectPr"))
+    for line in lines:
+        p = OxmlElement("w:p")
+        if style_id is not None:
+            p_pr = OxmlElement("w:pPr")
+            p_style = OxmlElement("w:pStyle")
+            p_style.set(qn("w:val"), style_id)
+            p_pr.append(p_style)
+            p.append(p_pr)
+        r = OxmlElement("w:r")
+        t = OxmlElement("w:t")
+        t.text = line
+        t.set(qn("xml:space"), "preserve")
+        r.append(t)
+        p.append(r)
+        if sect_pr is not None:
+            sect_pr.addprevious(p)
+        else:
+            body.append(p)
+
+
+_template_bytes = None
+
+
+def _new_document() -> Document:
+    """Create a Document from an in-memory copy of the default template.
+
+    Document() re-reads and unzips python-docx's packaged default.docx on
+    every call; caching the bytes once keeps repeated report builds in a
+    long-running process off the filesystem.
+    """
+    from docx import Document
+
+    global _template_bytes
+    if _template_bytes is None:
+        import docx
+
+        template = Path(docx.__path__[0]) / "templates" / "default.docx"
+        _template_bytes = template.read_bytes()
+    return Document(BytesIO(_template_bytes))
+
+
+def _fast_row(table, label, value) -> None:
+    """Append a two-cell row to the table via direct XML.
+
+    Equivalent to add_row().cells plus .text assignment, minus the _Cell
+    wrapper construction and run-clearing walk python-docx does per cell.
+    """
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+
+    tr = OxmlElement("w:tr")
+    for text in (label, "" if value is None else str(value)):
+        tc = OxmlElement("w:tc")
+        p = OxmlElement("w:p")
+        r = OxmlElement("w:r")
+        t = OxmlElement("w:t")
+        t.text = text
+        t.set(qn("xml:space"), "preserve")
+        r.append(t)
+        p.append(r)
+        tc.append(p)
+        tr.append(tc)
+    table._tbl.append(tr)
+
+
+# At 5 x 3 inches and 100 dpi the plot has ~500 horizontal pixels; more
+# points than that just cost Agg draw calls and PNG bytes.
+_MAX_PLOT_POINTS = 500
+
+
+def _draw_sf_curve(ax, x, y, xlabel, ylabel, title) -> None:
+    """Apply the standard SF-curve styling to the given axes."""
+    ax.clear()
     ax.plot(x, y, marker="o")
     ax.set_title(title)
     ax.set_xlabel(xlabel)
@@ -33,14 +184,135 @@ def _plot_sf_curve(x, y, xlabel, ylabel, title, out_path: Path):
     for level in (1.0, 1.5):
         ax.axhline(level, color="grey", linestyle=":", linewidth=0.8)
 
+
+def _tick_values(lo: float, hi: float, count: int = 5):
+    """Evenly spaced tick positions over [lo, hi]."""
+    if hi <= lo:
+        return [lo]
+    step = (hi - lo) / (count - 1)
+    return [lo + i * step for i in range(count)]
+
+
+def _render_sf_curve_png_pil(job) -> bytes:
+    """Render one SF curve to PNG bytes by drawing lines directly.
+
+    These plots are a polyline, a grid and two guide lines — a tiny
+    fraction of what a matplotlib figure sets up (font manager,
+    transforms, tick locators). Pixel coordinates are computed by hand
+    on a 500x300 canvas, matching the 5x3 inch / 100 dpi figure the
+    matplotlib path produces.
+    """
+    x, y, xlabel, ylabel, title = job
+    width, height = 500, 300
+    left, right, top, bottom = 60, 15, 28, 42
+    plot_w = width - left - right
+    plot_h = height - top - bottom
+
+    finite = [(a, b) for a, b in zip(x, y) if math.isfinite(a) and math.isfinite(b)]
+    x_min = min((a for a, _ in finite), default=0.0)
+    x_max = max((a for a, _ in finite), default=1.0)
+    y_min = min((b for _, b in finite), default=0.0)
+    y_max = max((b for _, b in finite), default=1.0)
+    if x_max <= x_min:
+        x_max = x_min + 1.0
+    if y_max <= y_min:
+        y_max = y_min + 1.0
+    # ~5% data margin, like matplotlib's default autoscale padding
+    x_pad = (x_max - x_min) * 0.05
+    y_pad = (y_max - y_min) * 0.05
+    x_min, x_max = x_min - x_pad, x_max + x_pad
+    y_min, y_max = y_min - y_pad, y_max + y_pad
+
+    def px(a: float) -> float:
+        return left + (a - x_min) / (x_max - x_min) * plot_w
+
+    def py(b: float) -> float:
+        return top + (y_max - b) / (y_max - y_min) * plot_h
+
+    img = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(img)
+    font = ImageFont.load_default()
+    grid = (220, 220, 220)
+    guide = (150, 150, 150)
+    frame = (90, 90, 90)
+    line = (31, 119, 180)  # matplotlib tab:blue
+
+    x_ticks = _tick_values(x_min + x_pad, x_max - x_pad)
+    y_ticks = _tick_values(y_min + y_pad, y_max - y_pad)
+    for tx in x_ticks:
+        draw.line([(px(tx), top), (px(tx), top + plot_h)], fill=grid)
+        draw.text((px(tx), top + plot_h + 4), f"{tx:g}", fill="black", font=font, anchor="ma")
+    for ty in y_ticks:
+        draw.line([(left, py(ty)), (left + plot_w, py(ty))], fill=grid)
+        draw.text((left - 4, py(ty)), f"{ty:.2g}", fill="black", font=font, anchor="rm")
+
+    # Horizontal guides at SF = 1 and 1.5 to mirror the app visuals
+    for level in (1.0, 1.5):
+        if y_min <= level <= y_max:
+            draw.line([(left, py(level)), (left + plot_w, py(level))], fill=guide)
+
+    draw.rectangle([left, top, left + plot_w, top + plot_h], outline=frame)
+
+    points = [(px(a), py(b)) for a, b in finite]
+    if len(points) > 1:
+        draw.line(points, fill=line, width=2)
+    for cx, cy in points:
+        draw.ellipse([cx - 3, cy - 3, cx + 3, cy + 3], fill=line)
+
+    draw.text((left + plot_w / 2, 6), title, fill="black", font=font, anchor="ma")
+    draw.text((left + plot_w / 2, height - 14), xlabel, fill="black", font=font, anchor="ma")
+    draw.text((4, top - 10), ylabel, fill="black", font=font, anchor="la")
+
+    buf = BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+# One figure/axes pair per process for the matplotlib fallback; cleared
+# and redrawn between curves so nothing is torn down and re-allocated.
+_mpl_fig_ax = None
+
+
+def _render_sf_curve_png_mpl(job) -> bytes:
+    """Render one SF curve to PNG bytes with matplotlib."""
+    import matplotlib
+
+    # This path only rasterizes PNGs; never let matplotlib pick a GUI backend.
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    global _mpl_fig_ax
+    if _mpl_fig_ax is None:
+        _mpl_fig_ax = plt.subplots(figsize=(5, 3))
+    fig, ax = _mpl_fig_ax
+
+    x, y, xlabel, ylabel, title = job
+    _draw_sf_curve(ax, x, y, xlabel, ylabel, title)
     fig.tight_layout()
-    fig.savefig(out_path, dpi=150)
-    plt.close(fig)
-    return out_path
+    buf = BytesIO()
+    # 100 dpi is plenty: the picture is scaled to 5 inches in Word anyway.
+    fig.savefig(buf, format="png", dpi=100)
+    return buf.getvalue()
+
+
+def _render_sf_curve_png(job) -> bytes:
+    """Render one SF curve to PNG bytes.
+
+    ``job`` is a ``(x, y, xlabel, ylabel, title)`` tuple of plain data so
+    this stays picklable — it doubles as the process-pool worker when the
+    report has several graphs to render. Pillow draws the curve directly
+    when available; matplotlib is the fallback.
+    """
+    if Image is not None:
+        return _render_sf_curve_png_pil(job)
+    return _render_sf_curve_png_mpl(job)
 
 
 def build_word_report(json_path: Path, output_path: Path | None = None) -> Path:
-    data = json.loads(json_path.read_text(encoding="utf-8"))
+    import numpy as np
+    from docx.shared import Inches
+
+    data = _load_export(json_path)
 
     tree = data.get("tree", {})
     inputs = data.get("inputs", {})
@@ -49,7 +321,7 @@ def build_word_report(json_path: Path, output_path: Path | None = None) -> Path:
     graphs = data.get("graphs", {})
     text = data.get("text", {})
 
-    doc = Document()
+    doc = _new_document()
 
     # Title
     title = tree.get("label") or "AusTreeCalc tree stability report"
@@ -70,21 +342,15 @@ def build_word_report(json_path: Path, output_path: Path | None = None) -> Path:
     table = doc.add_table(rows=0, cols=2)
     table.style = "Light Grid"
 
-    def _row(label: str, value) -> None:
-        row = table.add_row().cells
-        row[0].text = label
-        row[1].text = "" if value is None else str(value)
-
-    _row("DBH (cm)", inputs.get("dbh_cm"))
-    _row("Height (m)", inputs.get("height_m"))
-    _row("Crown diameter (m)", inputs.get("crown_diameter_m"))
-    _row("Cavity inner diameter (cm)", inputs.get("cavity_inner_diameter_cm"))
-    _row("Design wind speed (m/s)", inputs.get("design_wind_speed_ms"))
-    _row("Site factor", inputs.get("site_factor"))
+    _fast_row(table, "DBH (cm)", inputs.get("dbh_cm"))
+    _fast_row(table, "Height (m)", inputs.get("height_m"))
+    _fast_row(table, "Crown diameter (m)", inputs.get("crown_diameter_m"))
+    _fast_row(table, "Cavity inner diameter (cm)", inputs.get("cavity_inner_diameter_cm"))
+    _fast_row(table, "Design wind speed (m/s)", inputs.get("design_wind_speed_ms"))
+    _fast_row(table, "Site factor", inputs.get("site_factor"))
 
     # Defects
     doc.add_heading("Observed structural defects / decay indicators", level=1)
-    defect_list = doc.add_paragraph(style="List Bullet")
     flags = [
         ("Bracket fungi on stem or base", defects.get("bracket_fungi")),
         ("Cavity with visible decay", defects.get("cavity_decay")),
@@ -92,18 +358,13 @@ def build_word_report(json_path: Path, output_path: Path | None = None) -> Path:
         ("Basal/root-plate decay symptoms", defects.get("basal_decay")),
         ("Included bark / compromised unions", defects.get("union")),
     ]
-    any_flag = False
-    for label, flag in flags:
-        if flag:
-            defect_list = doc.add_paragraph(style="List Bullet")
-            defect_list.add_run(label)
-            any_flag = True
+    active = [label for label, flag in flags if flag]
     other = defects.get("other")
     if other:
-        defect_list = doc.add_paragraph(style="List Bullet")
-        defect_list.add_run(str(other))
-        any_flag = True
-    if not any_flag:
+        active.append(str(other))
+    if active:
+        _add_paragraphs_fast(doc.element.body, active, style_id="ListBullet")
+    else:
         doc.add_paragraph("No specific structural defects selected.")
 
     k_defect = defects.get("strength_factor_k_defect")
@@ -116,20 +377,17 @@ def build_word_report(json_path: Path, output_path: Path | None = None) -> Path:
     short_summary = text.get("short_summary", "").strip()
     if short_summary:
         doc.add_heading("Short summary (AS 4970-aligned)", level=1)
-        for line in short_summary.splitlines():
-            doc.add_paragraph(line)
+        _add_paragraphs_fast(doc.element.body, short_summary.splitlines())
 
     technical = text.get("technical_appendix", "").strip()
     if technical:
         doc.add_heading("Technical appendix", level=1)
-        for line in technical.splitlines():
-            doc.add_paragraph(line)
+        _add_paragraphs_fast(doc.element.body, technical.splitlines())
 
     base_calc = text.get("base_calculation", "").strip()
     if base_calc:
         doc.add_heading("Base calculation breakdown", level=1)
-        for line in base_calc.splitlines():
-            doc.add_paragraph(line)
+        _add_paragraphs_fast(doc.element.body, base_calc.splitlines())
 
     # Decay / residual wall info
     if decay:
@@ -147,64 +405,60 @@ def build_word_report(json_path: Path, output_path: Path | None = None) -> Path:
                 f"about {crit:.0f}% of diameter (≈ {crit_wall:.1f} cm on each side)."
             )
 
-    # Graphs
-    image_dir = output_path.parent if output_path is not None else json_path.parent
-    image_dir.mkdir(parents=True, exist_ok=True)
-
+    # Graphs (rendered straight into the document; no temp PNGs on disk).
+    # Collect render jobs first; the three curves are independent, so
+    # with more than one present they rasterize in parallel processes.
     doc.add_heading("Graphs", level=1)
 
-    fig_counter = 1
-
-    # SF vs wind
-    sf_wind = graphs.get("sf_vs_wind") or {}
-    x = sf_wind.get("wind_ms") or []
-    y = sf_wind.get("sf") or []
-    if x and y:
-        img_path = image_dir / "figure_sf_vs_wind.png"
-        _plot_sf_curve(x, y, "Wind speed (m/s)", "SF", "SF vs wind speed", img_path)
-        doc.add_paragraph(f"Figure {fig_counter} – Safety factor versus wind speed")
-        doc.add_picture(str(img_path), width=Inches(5.0))
-        fig_counter += 1
-
-    # SF vs residual wall
-    sf_rw = graphs.get("sf_vs_residual_wall") or {}
-    x = sf_rw.get("residual_wall_percent") or []
-    y = sf_rw.get("sf") or []
-    if x and y:
-        img_path = image_dir / "figure_sf_vs_residual_wall.png"
-        _plot_sf_curve(
-            x,
-            y,
+    jobs = []
+    captions = []
+    for key, x_key, xlabel, title, caption in (
+        (
+            "sf_vs_wind",
+            "wind_ms",
+            "Wind speed (m/s)",
+            "SF vs wind speed",
+            "Safety factor versus wind speed",
+        ),
+        (
+            "sf_vs_residual_wall",
+            "residual_wall_percent",
             "Residual wall (% of diameter)",
-            "SF",
             "SF vs residual wall",
-            img_path,
-        )
-        doc.add_paragraph(
-            f"Figure {fig_counter} – Safety factor versus residual wall thickness"
-        )
-        doc.add_picture(str(img_path), width=Inches(5.0))
-        fig_counter += 1
-
-    # SF vs crown reduction
-    sf_red = graphs.get("sf_vs_crown_reduction") or {}
-    x = sf_red.get("reduction_percent") or []
-    y = sf_red.get("sf") or []
-    if x and y:
-        img_path = image_dir / "figure_sf_vs_crown_reduction.png"
-        _plot_sf_curve(
-            x,
-            y,
+            "Safety factor versus residual wall thickness",
+        ),
+        (
+            "sf_vs_crown_reduction",
+            "reduction_percent",
             "Crown reduction (%)",
-            "SF",
             "SF vs crown reduction",
-            img_path,
-        )
-        doc.add_paragraph(
-            f"Figure {fig_counter} – Safety factor versus crown reduction (%)"
-        )
-        doc.add_picture(str(img_path), width=Inches(5.0))
-        fig_counter += 1
+            "Safety factor versus crown reduction (%)",
+        ),
+    ):
+        g = graphs.get(key) or {}
+        x = g.get(x_key) or []
+        y = g.get("sf") or []
+        if x and y and len(x) == len(y):
+            # One list-to-ndarray conversion here; the renderers (and any
+            # future stats on the same data) reuse the contiguous buffers.
+            x = np.asarray(x, dtype=np.float64)
+            y = np.asarray(y, dtype=np.float64)
+            if len(x) > _MAX_PLOT_POINTS:
+                step = len(x) // _MAX_PLOT_POINTS
+                x = x[::step]
+                y = y[::step]
+            jobs.append((x, y, xlabel, "SF", title))
+            captions.append(caption)
+
+    if len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+            pngs = list(pool.map(_render_sf_curve_png, jobs))
+    else:
+        pngs = [_render_sf_curve_png(job) for job in jobs]
+
+    for fig_counter, (png, caption) in enumerate(zip(pngs, captions), start=1):
+        doc.add_paragraph(f"Figure {fig_counter} – {caption}")
+        doc.add_picture(BytesIO(png), width=Inches(5.0))
 
     if output_path is None:
         output_path = json_path.with_suffix(".docx")
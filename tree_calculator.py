@@ -1,5 +1,46 @@
 import math
 
+import numpy as np
+
+try:  # numba is optional: JIT-compiles the float kernels when installed
+    from numba import njit as _njit
+except ImportError:  # pragma: no cover - no-op fallback
+
+    def _njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def wrap(func):
+            return func
+
+        return wrap
+
+
+# Species growth rates in cm/year, shared by every tree_age_estimate call
+_GROWTH_RATES = {
+    'oak': 0.5,
+    'pine': 1.0,
+    'eucalyptus': 2.0,
+    'maple': 0.6,
+    'spruce': 0.8
+}
+_DEFAULT_GROWTH = 0.7  # cm/year for unknown species
+
+
+@_njit(cache=True)
+def _tree_volume(height_m: float, diameter_cm: float, tree_factor: float) -> float:
+    radius_m = (diameter_cm / 100) / 2  # Convert cm to m and get radius
+    cross_section = math.pi * (radius_m ** 2)
+    return cross_section * height_m * tree_factor
+
+
+@_njit(cache=True)
+def _carbon_storage(volume_m3: float, wood_density_kg_m3: float) -> float:
+    # Carbon content is about 50% of dry wood mass
+    dry_wood_mass_kg = volume_m3 * wood_density_kg_m3
+    return dry_wood_mass_kg * 0.5
+
+
 class TreeCalculator:
     """
     A calculator for various tree-related calculations.
@@ -18,10 +59,25 @@ class TreeCalculator:
         Returns:
             Volume in cubic meters
         """
-        radius_m = (diameter_cm / 100) / 2  # Convert cm to m and get radius
-        cross_section = math.pi * (radius_m ** 2)
-        return cross_section * height_m * tree_factor
+        return _tree_volume(height_m, diameter_cm, tree_factor)
     
+    @staticmethod
+    def calculate_tree_volume_batch(heights_m, diameters_cm, tree_factor: float = 0.5):
+        """
+        Calculate volumes for a batch of trees in one vectorized pass.
+
+        Args:
+            heights_m: Array-like of tree heights in meters
+            diameters_cm: Array-like of DBH values in centimeters
+            tree_factor: Shape factor (default 0.5 for most conifers)
+
+        Returns:
+            NumPy array of volumes in cubic meters
+        """
+        radius_m = np.asarray(diameters_cm, dtype=float) / 200.0  # cm diameter to m radius
+        heights = np.asarray(heights_m, dtype=float)
+        return np.pi * radius_m * radius_m * heights * tree_factor
+
     @staticmethod
     def estimate_carbon_storage(volume_m3: float, wood_density_kg_m3: float = 500) -> float:
         """
@@ -34,10 +90,23 @@ class TreeCalculator:
         Returns:
             Carbon storage in kilograms
         """
+        return _carbon_storage(volume_m3, wood_density_kg_m3)
+
+    @staticmethod
+    def estimate_carbon_storage_batch(volumes_m3, wood_density_kg_m3: float = 500):
+        """
+        Estimate carbon storage for a batch of tree volumes.
+
+        Args:
+            volumes_m3: Array-like of tree volumes in cubic meters
+            wood_density_kg_m3: Wood density in kg/m³ (default 500 kg/m³ for softwood)
+
+        Returns:
+            NumPy array of carbon storage values in kilograms
+        """
         # Carbon content is about 50% of dry wood mass
-        dry_wood_mass_kg = volume_m3 * wood_density_kg_m3
-        return dry_wood_mass_kg * 0.5
-    
+        return np.asarray(volumes_m3, dtype=float) * wood_density_kg_m3 * 0.5
+
     @staticmethod
     def tree_age_estimate(species: str, diameter_cm: float) -> float:
         """
@@ -50,16 +119,7 @@ class TreeCalculator:
         Returns:
             Estimated age in years
         """
-        growth_rates = {
-            'oak': 0.5,        # cm/year
-            'pine': 1.0,       # cm/year
-            'eucalyptus': 2.0, # cm/year
-            'maple': 0.6,      # cm/year
-            'spruce': 0.8      # cm/year
-        }
-        
-        growth_rate = growth_rates.get(species.lower(), 0.7)  # Default to 0.7 cm/year
-        return diameter_cm / growth_rate
+        return diameter_cm / _GROWTH_RATES.get(species.lower(), _DEFAULT_GROWTH)
 
 
 def main():